@@ -265,6 +265,18 @@ class Recorder(GObject.Object):
         """
         pass
 
+    def log_ioctl_tx(self, ioctl_name: str, data: bytes) -> None:
+        """
+        Log an ioctl invoked on the device with the given data
+        """
+        pass
+
+    def log_ioctl_rx(self, ioctl_name: str, data: bytes) -> None:
+        """
+        Log data returned by an ioctl on the device
+        """
+        pass
+
 
 @attr.s
 class CommitTransaction(GObject.Object):
@@ -9,7 +9,7 @@ from dbus_next.glib import MessageBus
 from dbus_next.service import ServiceInterface, method, dbus_property, signal
 from pathlib import Path
 from gi.repository import GLib
-from typing import List
+from typing import Any, Dict, List
 
 import attr
 import argparse
@@ -122,6 +122,19 @@ class RatbagResolution(ServiceInterface):
         )
         bus.export(self.objpath, self)
 
+    def properties(self) -> Dict[str, Variant]:
+        """
+        All properties of this interface, the same data
+        org.freedesktop.DBus.Properties.GetAll returns
+        """
+        return {
+            "Index": Variant("u", self.Index),
+            "IsActive": Variant("b", self.IsActive),
+            "IsDefault": Variant("b", self.IsDefault),
+            "Resolutions": Variant("au", self.Resolutions),
+            "Resolution": Variant("v", self.Resolution),
+        }
+
     @dbus_property(access=PropertyAccess.READ)
     def Index(self) -> "u":  # type: ignore
         return self._resolution.index
@@ -157,6 +170,10 @@ class RatbagResolution(ServiceInterface):
             x, y = res.value
         else:
             raise DBusError(make_name("ValueError"), "Resolution must be (uu)")
+        # Piper sends one Set per slider movement, don't signal a change
+        # for values we already have
+        if tuple(self._resolution.dpi) == (x, y):
+            return
         self._resolution.set_dpi((x, y))
         self.emit_properties_changed(
             {"Resolution": Variant("(uu)", list(self._resolution.dpi))}
@@ -194,6 +211,21 @@ class RatbagLed(ServiceInterface):
         )
         bus.export(self.objpath, self)
 
+    def properties(self) -> Dict[str, Variant]:
+        """
+        All properties of this interface, see
+        :meth:`RatbagResolution.properties`
+        """
+        return {
+            "Index": Variant("u", self.Index),
+            "Mode": Variant("u", self.Mode),
+            "Modes": Variant("au", self.Modes),
+            "Color": Variant("(uuu)", self.Color),
+            "ColorDepth": Variant("u", self.ColorDepth),
+            "EffectDuration": Variant("u", self.EffectDuration),
+            "Brightness": Variant("u", self.Brightness),
+        }
+
     @dbus_property(access=PropertyAccess.READ)
     def Index(self) -> "u":  # type: ignore
         return self._led.index
@@ -210,6 +242,8 @@ class RatbagLed(ServiceInterface):
             2: ratbag.Led.Mode.CYCLE,
             3: ratbag.Led.Mode.BREATHING,
         }
+        if self._led.mode == modes[mode]:
+            return
         self._led.set_mode(modes[mode])
         self.emit_properties_changed({"Mode": modes[mode]})
 
@@ -224,6 +258,8 @@ class RatbagLed(ServiceInterface):
     @Color.setter  # type: ignore
     def Color(self, color: "(uuu)"):  # type: ignore
         r, g, b = color
+        if tuple(self._led.color) == (r, g, b):
+            return
         self._led.set_color((r, g, b))
         self.emit_properties_changed({"Color": (r, g, b)})
 
@@ -237,6 +273,8 @@ class RatbagLed(ServiceInterface):
 
     @EffectDuration.setter  # type: ignore
     def EffectDuration(self, duration: "u"):  # type: ignore
+        if self._led.effect_duration == duration:
+            return
         self._led.set_effect_duration(duration)
         self.emit_properties_changed({"EffectDuration": duration})
 
@@ -246,6 +284,8 @@ class RatbagLed(ServiceInterface):
 
     @Brightness.setter  # type: ignore
     def Brightness(self, brightness: "u"):  # type: ignore
+        if self._led.brightness == brightness:
+            return
         self._led.set_brightness(brightness)
         self.emit_properties_changed({"Brightness": brightness})
 
@@ -265,6 +305,17 @@ class RatbagButton(ServiceInterface):
         )
         bus.export(self.objpath, self)
 
+    def properties(self) -> Dict[str, Variant]:
+        """
+        All properties of this interface, see
+        :meth:`RatbagResolution.properties`
+        """
+        return {
+            "Index": Variant("u", self.Index),
+            "Mapping": Variant("(uv)", self.Mapping),
+            "ActionTypes": Variant("au", self.ActionTypes),
+        }
+
     @dbus_property(access=PropertyAccess.READ)
     def Index(self) -> "u":  # type: ignore
         return self._button.index
@@ -275,17 +326,15 @@ class RatbagButton(ServiceInterface):
         value = None
 
         if action.type == ratbag.Action.Type.BUTTON:
-            value = dbus_next.Variant("u", int(action.button))
+            value = Variant("u", int(action.button))
         elif action.type == ratbag.Action.Type.SPECIAL:
-            value = dbus_next.Variant("u", int(action.special))
+            value = Variant("u", int(action.special))
         # elif action.type == ratbag.Action.Type.KEY:
-        #    value = dbus_next.Variant("u", int(ratbag.Action.Type.UNKNOWN))  # FIXME
+        #    value = Variant("u", int(ratbag.Action.Type.UNKNOWN))  # FIXME
         elif action.type == ratbag.Action.Type.MACRO:
-            value = dbus_next.Variant(
-                "a(uu)", [[e[0].value, e[1]] for e in action.events]
-            )
+            value = Variant("a(uu)", [[int(t), v] for t, v in action.events])
         else:
-            value = dbus_next.Variant("u", int(ratbag.Action.Type.UNKNOWN))
+            value = Variant("u", int(ratbag.Action.Type.UNKNOWN))
 
         assert value is not None
         return [action.type.value, value]
@@ -333,6 +382,25 @@ class RatbagProfile(ServiceInterface):
         self._leds = [RatbagLed(bus, r) for r in ratbag_profile.leds]
         bus.export(self.objpath, self)
 
+    def properties(self) -> Dict[str, Variant]:
+        """
+        All properties of this interface, see
+        :meth:`RatbagResolution.properties`
+        """
+        return {
+            "Index": Variant("u", self.Index),
+            "Name": Variant("s", self.Name),
+            "Capabilities": Variant("au", self.Capabilities),
+            "Enabled": Variant("b", self.Enabled),
+            "ReportRates": Variant("au", self.ReportRates),
+            "ReportRate": Variant("u", self.ReportRate),
+            "IsActive": Variant("b", self.IsActive),
+            "IsDefault": Variant("b", self.IsDefault),
+            "Resolutions": Variant("ao", self.Resolutions),
+            "Buttons": Variant("ao", self.Buttons),
+            "Leds": Variant("ao", self.Leds),
+        }
+
     @dbus_property(access=PropertyAccess.READ)
     def Index(self) -> "u":  # type: ignore
         return self._profile.index
@@ -411,7 +479,7 @@ class RatbagdDevice(ServiceInterface):
         self._device = ratbag_device
         self._bus = bus
         self.objpath = make_path("device", ratbag_device.path.name)
-        self._profiles = list(RatbagProfile(bus, p) for p in ratbag_device.profiles)
+        self._profiles = [RatbagProfile(bus, p) for p in ratbag_device.profiles]
         bus.export(self.objpath, self)
 
     @dbus_property(access=PropertyAccess.READ)
@@ -432,6 +500,22 @@ class RatbagdDevice(ServiceInterface):
         self._device.commit()
         return 0
 
+    @method()
+    def Snapshot(self) -> "a(oa{sv})":  # type: ignore
+        """
+        Returns the object path and all properties of every profile,
+        resolution, button and led on this device in a single call. This
+        avoids one round-trip per property on startup, the individual
+        properties remain available as before.
+        """
+        objects: List[Any] = []
+        for p in self._profiles:
+            objects.append(p)
+            objects.extend(p._resolutions)
+            objects.extend(p._buttons)
+            objects.extend(p._leds)
+        return [[o.objpath, o.properties()] for o in objects]
+
     @signal()
     def Resync(self) -> None:
         logger.debug(f"Signal resync for  {self._device.name}")
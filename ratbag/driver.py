@@ -7,26 +7,53 @@
 
 import attr
 import enum
+import errno
 import fcntl
+import functools
+import importlib
+import itertools
 import logging
 import pathlib
-import pyudev
 import os
+import re
 import select
 import struct
-
-from typing import Any, Dict, List, Optional, Tuple, Union, Type
+import weakref
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    Type,
+    TYPE_CHECKING,
+)
 
 from gi.repository import GObject, GLib
 
 import ratbag
 import ratbag.hid
 
+if TYPE_CHECKING:
+    # pyudev pulls in libudev, only import it once we need it
+    import pyudev
+
 logger = logging.getLogger(__name__)
 
 # Contains loaded @ratbag_driver classes
 DRIVERS: Dict[str, Type["ratbag.driver.Driver"]] = {}
 
+# How long udev add events need to be quiet before we process them
+_HOTPLUG_SETTLE_MS = 50
+
+# HID_MAX_BUFFER_SIZE in the kernel, hidraw never returns more than this
+# per read()
+_HIDRAW_MAX_REPORT_SIZE = 4096
+
 
 @attr.s
 class DriverUnavailable(Exception):
@@ -124,24 +151,30 @@ def load_driver_by_name(driver_name: str) -> Optional[Type["Driver"]]:
 
     :return: The driver **class** (not an instance thereof) or ``None`` on error
     """
-    if not DRIVERS:
-        # Try to import ratbag.drivers.foo
-        logger.debug(f"Loading drivers")
-        try:
-            import importlib
-
-            for mod in pathlib.Path("ratbag/drivers/").glob("*.py"):
-                importlib.import_module(f"ratbag.drivers.{mod.name[:-3]}")
-        except ImportError as e:
-            logger.warning(f"Importing ratbag.drivers.{mod} failed: {e}")
+    cls = DRIVERS.get(driver_name)
+    if cls is not None:
+        return cls
 
+    # Only import the one module we need, driver names may use dashes
+    # where the module uses underscores
+    module = f"ratbag.drivers.{driver_name.replace('-', '_')}"
+    logger.debug(f"Loading driver module {module}")
     try:
-        return DRIVERS[driver_name]
-    except KeyError:
+        importlib.import_module(module)
+    except ModuleNotFoundError as e:
+        # Not an error if we just don't have that driver (yet)
+        if e.name != module:
+            logger.warning(f"Importing {module} failed: {e}")
+    except ImportError as e:
+        logger.warning(f"Importing {module} failed: {e}")
+
+    cls = DRIVERS.get(driver_name)
+    if cls is None:
         raise DriverUnavailable(f"Unable to find driver '{driver_name}'")
+    return cls
 
 
-class Message(GObject.Object):
+class Message:
     """
     A message sent to the device or received from the device. This object
     exists to standardize logging attempts. Drivers should, where possible,
@@ -150,6 +183,11 @@ class Message(GObject.Object):
     Messages are usually logged as ``type subtype direction data``
     """
 
+    NAME = ""
+    """
+    The type of this message, e.g. ``"ioctl"``.
+    """
+
     SUBTYPE = ""
     """
     The subtype of this message. Used e.g. by ioctls to specify which ioctl
@@ -166,6 +204,8 @@ class Message(GObject.Object):
         IOC = enum.auto()
         """An ioctl invocation on the device"""
 
+    __slots__ = ("direction", "bytes", "msgtype", "subtype")
+
     def __init__(self, bytes: bytes, direction: Direction = Direction.TX):
         self.direction = direction
         self.bytes = bytes
@@ -173,7 +213,7 @@ class Message(GObject.Object):
         self.subtype = type(self).SUBTYPE
 
     def __str__(self) -> str:
-        bytestr = " ".join(f"{b:02x}" for b in self.bytes)
+        bytestr = self.bytes.hex(" ")
         if self.subtype:
             subtype = f" {self.subtype}"
         else:
@@ -181,24 +221,27 @@ class Message(GObject.Object):
         return f"{self.msgtype}{subtype} {self.direction.name} ({len(self.bytes)}): {bytestr}"
 
 
+_BUSES = frozenset(("bluetooth", "usb"))
+# An optional trailing :version is allowed and ignored
+_USBID = re.compile(r"(usb|bluetooth):([0-9a-fA-F]{1,4}):([0-9a-fA-F]{1,4})(?=:|$)")
+
+
 @attr.frozen
 class UsbId:
-    bus: str = attr.ib(validator=attr.validators.in_(("bluetooth", "usb")))
+    bus: str = attr.ib()
     """The bus type, one of ``["usb", "bluetooth"]``"""
     vid: int = attr.ib()
     """The vendor ID"""
     pid: int = attr.ib()
     """The Product ID"""
+    _str: str = attr.ib(init=False, eq=False, repr=False)
 
-    @vid.validator
-    def _validate_vid(self, attribute, value):
-        if not 0 <= value <= 0xFFFF:
-            raise attr.ValueError("vid must be <= 0xffff")
-
-    @pid.validator
-    def _validate_pid(self, attribute, value):
-        if not 0 <= value <= 0xFFFF:
-            raise attr.ValueError("pid must be <= 0xffff")
+    def __attrs_post_init__(self):
+        usbid = f"{self.bus}:{self.vid:04x}:{self.pid:04x}"
+        if self.bus not in _BUSES or (self.vid | self.pid) & ~0xFFFF:
+            raise ValueError(f"Invalid USB ID {usbid}")
+        # frozen, so the string never changes
+        object.__setattr__(self, "_str", usbid)
 
     @staticmethod
     def from_string(string: str) -> "UsbId":
@@ -207,14 +250,11 @@ class UsbId:
 
         :raises ValueError: if the string does not match the required format.
         """
-        try:
-            tokens = string.split(":")
-            bus = tokens[0]
-            vid = int(tokens[1], 16)
-            pid = int(tokens[2], 16)
-            return UsbId(bus, vid, pid)
-        except Exception:
+        match = _USBID.match(string)
+        if not match:
             raise ValueError(f"Invalid USB ID token {string}")
+        bus, vid, pid = match.groups()
+        return UsbId(bus, int(vid, 16), int(pid, 16))
 
     @staticmethod
     def from_string_sequence(string: str) -> List["UsbId"]:
@@ -228,7 +268,7 @@ class UsbId:
         return [UsbId.from_string(e) for e in entries]
 
     def __str__(self):
-        return f"{self.bus}:{self.vid:04x}:{self.pid:04x}"
+        return self._str
 
 
 class HidrawMonitor(GObject.Object):
@@ -258,11 +298,14 @@ class HidrawMonitor(GObject.Object):
 
     def __init__(self):
         GObject.Object.__init__(self)
-        self._context = pyudev.Context()
+        self._context = _udev_context()
         self._has_started = False
         self._disabled = False
         self._fake_rodents = []
         self._rodents = []
+        # udev devices added but not yet turned into rodents, by device node
+        self._pending: Dict[str, "pyudev.Device"] = {}
+        self._pending_source = 0
 
     def list(self) -> List["Rodent"]:
         """
@@ -286,6 +329,8 @@ class HidrawMonitor(GObject.Object):
         if self._disabled or self._has_started:
             return
 
+        import pyudev
+
         self._has_started = True
         monitor = pyudev.Monitor.from_netlink(self._context)
         monitor.filter_by(subsystem="hidraw")
@@ -294,32 +339,77 @@ class HidrawMonitor(GObject.Object):
             device = monitor.poll(0)
             while device:
                 logger.debug(f"udev monitor: {device.action} {device.device_node}")
-                if device.action == "add":
-
-                    def add_udev_device(udev_device):
-                        rodent = Rodent.from_udev_device(device)
-                        self._rodents.append(rodent)
-                        self.emit("rodent-found", rodent)
-
-                    add_udev_device(device)
-                elif device.action == "remove":
-                    try:
-                        r = next(
-                            r for r in self._rodents if r.path == device.device_node
-                        )
-                        r.emit("disconnected")
-                        self._rodents.remove(r)
-                    except StopIteration:
-                        pass
-
+                try:
+                    self._handle_udev_event(device)
+                except Exception as e:
+                    # an exception would remove this watch and we'd stop
+                    # seeing any devices
+                    logger.error(f"udev monitor: failed to handle {device}: {e}")
                 device = monitor.poll(0)
             return True  # keep the callback
 
+        # The filter is installed on the netlink socket, the kernel drops
+        # all non-hidraw events before they get to us
         GLib.io_add_watch(monitor, 0, GLib.IO_IN, udev_monitor_callback, monitor)
         monitor.start()
 
-        for device in self._context.list_devices(subsystem="hidraw"):
-            self._rodents.append(Rodent.from_udev_device(device))
+        # udev is only needed for hotplug, for the devices already present
+        # we can read sysfs directly
+        try:
+            with os.scandir("/sys/class/hidraw") as it:
+                entries = sorted(e.path for e in it if e.name.startswith("hidraw"))
+        except FileNotFoundError:  # hidraw module not loaded
+            entries = []
+        for entry in entries:
+            info = DeviceInfo.from_sysfs(pathlib.Path(entry))
+            self._rodents.append(Rodent.from_device_info(info))
+
+    def _handle_udev_event(self, device: "pyudev.Device") -> None:
+        if device.action == "add":
+            # A hub or receiver plugging in gives us a burst of
+            # events, process those in one go once they stop coming in
+            self._pending[device.device_node] = device
+            if self._pending_source:
+                GLib.source_remove(self._pending_source)
+            self._pending_source = GLib.timeout_add(
+                _HOTPLUG_SETTLE_MS, self._add_pending
+            )
+        elif device.action == "remove":
+            self._pending.pop(device.device_node, None)
+            # drop what we know about the removed device, a new one may
+            # reuse its syspath
+            _udev_lookup.cache_clear()
+            path = pathlib.Path(device.device_node)
+            for r in [r for r in self._rodents if r.path == path]:
+                r.emit("disconnected")
+                r.close()
+                self._rodents.remove(r)
+
+    def _add_pending(self) -> bool:
+        import pyudev
+
+        self._pending_source = 0
+        pending, self._pending = self._pending, {}
+        for device in pending.values():
+            # Already known from the sysfs scan in start() if the device
+            # was plugged in while we started up, or a synthetic add event
+            # (udevadm trigger) for a device we already have
+            path = pathlib.Path(device.device_node)
+            if any(r.path == path for r in self._rodents):
+                continue
+            try:
+                rodent = Rodent.from_udev_device(device)
+            except (pyudev.DeviceNotFoundError, FileNotFoundError):
+                # unplugged again before we got to it
+                logger.debug(f"udev monitor: {device.device_node} disappeared")
+                continue
+            except Exception as e:
+                # don't let one broken device drop the rest of the burst
+                logger.error(f"udev monitor: failed to add {device}: {e}")
+                continue
+            self._rodents.append(rodent)
+            self.emit("rodent-found", rodent)
+        return False  # remove the timeout source
 
     def disable(self):
         """
@@ -350,7 +440,7 @@ class HidrawMonitor(GObject.Object):
         return cls._instance
 
 
-@attr.s
+@attr.s(slots=True)
 class DeviceInfo:
     """
     Information about a device. This is information collected about a device
@@ -386,24 +476,93 @@ class DeviceInfo:
         return f"{self.bus}:{self.vid:04x}:{self.pid:04x}:{version}"
 
     @staticmethod
-    def from_path(path: pathlib.Path) -> "DeviceInfo":
-        context = pyudev.Context()
-        device = pyudev.Devices.from_device_file(context, path)
+    def from_path(
+        path: pathlib.Path, load_report_descriptor: bool = True
+    ) -> "DeviceInfo":
+        """
+        Create the :class:`DeviceInfo` for the given device node. If
+        ``load_report_descriptor`` is ``False``, the report descriptor is
+        not read and :attr:`report_descriptor` is ``None``.
+        """
+        # hidraw nodes can be looked up in sysfs directly, only fall back
+        # to udev if that fails
+        hidraw = pathlib.Path("/sys/class/hidraw", path.resolve().name)
+        if hidraw.exists():
+            return DeviceInfo.from_sysfs(
+                hidraw, path, load_report_descriptor=load_report_descriptor
+            )
+
+        import pyudev
+
+        device = pyudev.Devices.from_device_file(_udev_context(), path)
+        return DeviceInfo.from_udev_device(
+            device, path, load_report_descriptor=load_report_descriptor
+        )
 
-        def find_prop(device, prop: str) -> Optional[str]:
-            try:
-                return device.properties[prop]
-            except KeyError:
-                try:
-                    return find_prop(next(device.ancestors), prop)
-                except StopIteration:
-                    return None
+    @staticmethod
+    def from_udev_device(
+        device: "pyudev.Device",
+        path: Optional[pathlib.Path] = None,
+        load_report_descriptor: bool = True,
+    ) -> "DeviceInfo":
+        """
+        Create the :class:`DeviceInfo` from an already looked-up udev
+        device, e.g. one from a udev event. See :meth:`from_path` for
+        ``load_report_descriptor``.
+        """
+        if path is None:
+            path = pathlib.Path(device.device_node)
+        props = _udev_lookup(device)
+        if load_report_descriptor:
+            # hidrawN/device is the HID device, no need to search for it
+            report_descriptor = _read_report_descriptor(
+                pathlib.Path(device.sys_path, "device")
+            )
+        else:
+            report_descriptor = None
+        return DeviceInfo._from_properties(
+            path, pathlib.Path(device.sys_path), props, report_descriptor
+        )
+
+    @staticmethod
+    def from_sysfs(
+        hidraw: pathlib.Path,
+        path: Optional[pathlib.Path] = None,
+        load_report_descriptor: bool = True,
+    ) -> "DeviceInfo":
+        """
+        Create the :class:`DeviceInfo` from the given
+        ``/sys/class/hidraw/hidrawN`` directory. This reads the sysfs
+        files directly and is much cheaper than going through udev with
+        :meth:`from_udev_device`. See :meth:`from_path` for
+        ``load_report_descriptor``.
+        """
+        if path is None:
+            path = pathlib.Path("/dev") / hidraw.name
+        props = _sysfs_lookup(hidraw)
+        if load_report_descriptor:
+            report_descriptor = _read_report_descriptor(hidraw / "device")
+        else:
+            report_descriptor = None
+        return DeviceInfo._from_properties(
+            path,
+            hidraw.resolve(),
+            props,
+            report_descriptor,
+        )
 
-        vidstr = find_prop(device, "ID_VENDOR_ID")
-        pidstr = find_prop(device, "ID_MODEL_ID")
-        busstr = find_prop(device, "ID_BUS")
+    @staticmethod
+    def _from_properties(
+        path: pathlib.Path,
+        syspath: pathlib.Path,
+        props: Dict[str, Optional[str]],
+        report_descriptor: Optional[bytes],
+    ) -> "DeviceInfo":
+        vidstr = props["ID_VENDOR_ID"]
+        pidstr = props["ID_MODEL_ID"]
+        busstr = props["ID_BUS"]
         if not vidstr or not pidstr or not busstr:
-            hidstr = find_prop(device, "HID_ID")
+            hidstr = props["HID_ID"]
             assert hidstr
             try:
                 bid, vid, pid = map(lambda x: int(x, 16), hidstr.split(":"))
@@ -414,24 +573,7 @@ class DeviceInfo:
             vid = int(vidstr, 16)  # type: ignore
             pid = int(pidstr, 16)  # type: ignore
             bus = busstr or "unknown"
-        name = (
-            find_prop(device, "HID_NAME") or f"Unnamed HID device {vid:04x}:{pid:04x}"
-        )
-        syspath = device.sys_path
-
-        def find_report_descriptor(device) -> Optional[bytes]:
-            try:
-                with open(
-                    pathlib.Path(device.sys_path) / "report_descriptor", "rb"
-                ) as fd:
-                    return fd.read()
-            except FileNotFoundError:
-                try:
-                    return find_report_descriptor(next(device.ancestors))
-                except StopIteration:
-                    return None
-
-        report_descriptor = find_report_descriptor(device)
+        name = props["HID_NAME"] or f"Unnamed HID device {vid:04x}:{pid:04x}"
 
         return DeviceInfo(
             path=path,
@@ -444,6 +586,94 @@ class DeviceInfo:
         )
 
 
+@functools.lru_cache(maxsize=1)
+def _udev_context() -> "pyudev.Context":
+    """
+    The pyudev context shared by everything in this module
+    """
+    import pyudev
+
+    return pyudev.Context()
+
+
+@functools.lru_cache(maxsize=32)
+def _udev_lookup(device: "pyudev.Device") -> Dict[str, Optional[str]]:
+    """
+    Walk the device and its ancestors once and return the properties we
+    need. Each property is taken from the closest device that has it set
+    (or ``None``).
+
+    pyudev devices compare and hash by their device path, so the result is
+    cached per device. The cache is cleared whenever a hidraw device is
+    removed.
+    """
+    props: Dict[str, Optional[str]] = dict.fromkeys(
+        ("ID_VENDOR_ID", "ID_MODEL_ID", "ID_BUS", "HID_ID", "HID_NAME")
+    )
+
+    for d in itertools.chain([device], device.ancestors):
+        for key, value in props.items():
+            if value is None:
+                props[key] = d.properties.get(key)
+        if None not in props.values():
+            break
+
+    return props
+
+
+def _read_report_descriptor(hiddev: pathlib.Path) -> Optional[bytes]:
+    """
+    Return the report descriptor of the given HID device's sysfs directory
+    or ``None`` if it doesn't have one.
+    """
+    try:
+        return (hiddev / "report_descriptor").read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _sysfs_lookup(hidraw: pathlib.Path) -> Dict[str, Optional[str]]:
+    """
+    The equivalent to :func:`_udev_lookup` for a ``/sys/class/hidraw/hidrawN``
+    directory, without going through udev. ``HID_ID`` and ``HID_NAME`` come
+    from the HID device's uevent file, the ``ID_*`` properties are what
+    udev's usb_id would set from the closest USB device.
+    """
+    props: Dict[str, Optional[str]] = dict.fromkeys(
+        ("ID_VENDOR_ID", "ID_MODEL_ID", "ID_BUS", "HID_ID", "HID_NAME")
+    )
+    hiddev = (hidraw / "device").resolve()
+
+    for line in (hiddev / "uevent").read_text().splitlines():
+        key, _, value = line.partition("=")
+        if key in ("HID_ID", "HID_NAME"):
+            props[key] = value
+
+    for parent in hiddev.parents:
+        vid = parent / "idVendor"
+        if vid.exists():
+            props["ID_VENDOR_ID"] = vid.read_text().strip()
+            props["ID_MODEL_ID"] = (parent / "idProduct").read_text().strip()
+            props["ID_BUS"] = "usb"
+            break
+
+    return props
+
+
+def _close_fds(fd: int, poller: "select.epoll") -> None:
+    poller.close()
+    os.close(fd)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_report_descriptor(data: bytes) -> ratbag.hid.ReportDescriptor:
+    """
+    Parsing the same report descriptor more than once gives the same result,
+    so we only do it once per descriptor.
+    """
+    return ratbag.hid.ReportDescriptor.from_bytes(data)
+
+
 class Rodent(GObject.Object):
     """
     An class abstracting a physical device, connected via a non-blocking
@@ -459,14 +689,10 @@ class Rodent(GObject.Object):
     .. note:: The name Rodent was chosen to avoid confusion with :class:`ratbag.Device`.
 
     GObject Signals:
-        - ``data-to-device``, ``data-from-device``: the ``bytes`` that have
-          been written to or read from the device.
-        - ``ioctl-command``: an ioctl has been called on the device with the
-          given ioctl name and the data in ``bytes``
-        - ``ioctl-reply``: an ioctl has returned data in ``bytes``
-
-    These signals are primarily used by recorders, there should be no need to
-    handle those signals in other parts of the implementation.
+        - ``disconnected``: the device was removed from the system
+
+    Data sent to or received from the device is passed to any recorders
+    added with :meth:`enable_recorder` or :meth:`connect_to_recorder`.
     """
 
     __gsignals__ = {
@@ -475,33 +701,13 @@ class Rodent(GObject.Object):
             None,
             (),
         ),
-        "data-to-device": (
-            GObject.SignalFlags.RUN_FIRST,
-            None,
-            (GObject.TYPE_PYOBJECT,),
-        ),
-        "data-from-device": (
-            GObject.SignalFlags.RUN_FIRST,
-            None,
-            (GObject.TYPE_PYOBJECT,),
-        ),
-        "ioctl-command": (
-            GObject.SignalFlags.RUN_FIRST,
-            None,
-            # ioctl name (string), data (bytes)
-            (GObject.TYPE_PYOBJECT, GObject.TYPE_PYOBJECT),
-        ),
-        "ioctl-reply": (
-            GObject.SignalFlags.RUN_FIRST,
-            None,
-            # ioctl name (string), data (bytes)
-            (GObject.TYPE_PYOBJECT, GObject.TYPE_PYOBJECT),
-        ),
     }
 
     class Request(Message):
         """:meta private:"""
 
+        __slots__ = ()
+
         NAME = "fd"
 
         def __init__(self, bytes: bytes):
@@ -510,6 +716,8 @@ class Rodent(GObject.Object):
     class Reply(Message):
         """:meta private:"""
 
+        __slots__ = ()
+
         NAME = "fd"
 
         def __init__(self, bytes: bytes):
@@ -518,6 +726,8 @@ class Rodent(GObject.Object):
     class IoctlCommand(Message):
         """:meta private:"""
 
+        __slots__ = ()
+
         NAME = "ioctl"
 
         def __init__(self, name: str, bytes: bytes):
@@ -527,6 +737,8 @@ class Rodent(GObject.Object):
     class IoctlReply(Message):
         """:meta private:"""
 
+        __slots__ = ()
+
         NAME = "ioctl"
 
         def __init__(self, name: str, bytes: bytes):
@@ -539,42 +751,79 @@ class Rodent(GObject.Object):
         return r
 
     @classmethod
-    def from_udev_device(cls, udev_device: pyudev.Device) -> "ratbag.driver.Rodent":
-        info = DeviceInfo.from_path(pathlib.Path(udev_device.device_node))
+    def from_udev_device(cls, udev_device: "pyudev.Device") -> "ratbag.driver.Rodent":
+        info = DeviceInfo.from_udev_device(udev_device)
         return Rodent.from_device_info(info)
 
     @classmethod
-    def from_device(cls, device: Union[pathlib.Path, "ratbag.driver.Rodent"]):
+    def from_device(
+        cls,
+        device: Union[pathlib.Path, "ratbag.driver.Rodent"],
+        load_report_descriptor: bool = True,
+    ):
         """
         A simplification for drivers. If the given device is already a
         pre-setup device (from a recorder), this function returns that device.
         Otherwise, this function returns a :class:`ratbag.driver.Rodent`
         instance for the given device path.
+
+        Drivers that never use :meth:`hid_get_feature` or
+        :meth:`hid_set_feature` may set ``load_report_descriptor`` to
+        ``False`` to skip reading and parsing the report descriptor.
         """
         if isinstance(device, pathlib.Path):
-            info = DeviceInfo.from_path(device)
-            return Rodent(info)
+            info = DeviceInfo.from_path(
+                device, load_report_descriptor=load_report_descriptor
+            )
+            return Rodent(info, load_report_descriptor=load_report_descriptor)
         else:
             return device
 
-    def __init__(self, info: DeviceInfo):
+    def __init__(self, info: DeviceInfo, load_report_descriptor: bool = True):
         GObject.Object.__init__(self)
 
         self._info = info
-        if info.report_descriptor:
-            self._rdesc = ratbag.hid.ReportDescriptor.from_bytes(info.report_descriptor)
+        self._fd = -1
+        # Recorders are called directly rather than through GObject signals,
+        # signal emission is noticeable on the I/O paths
+        self._recorders: List[ratbag.Recorder] = []
+        # GetFeature request, reply buffer and ioctl number, reused per
+        # report ID
+        self._feature_buffers: Dict[int, Tuple[bytes, bytearray, int]] = {}
+        self._load_report_descriptor = load_report_descriptor
 
     def open(self):
         """
         Open the file descriptor for this device. This may raise any of the
-        exceptions ``open()`` may raise. The most common one is
+        exceptions ``os.open()`` may raise. The most common one is
         ``os.PermissionError`` if we have insufficient privileges to open the
-        device.
+        device. Opening an already open device does nothing, the same
+        rodent may be handed to more than one driver.
 
         :raises os.PermissionError: We do not have permissions to open this file
         """
-        self._fd = open(self.path, "r+b", buffering=0)
-        os.set_blocking(self._fd.fileno(), False)
+        if self._fd >= 0:
+            return
+
+        # hidraw gives us one report per read()/write(), so we use the fd
+        # directly rather than going through a Python file object
+        self._fd = os.open(self.path, os.O_RDWR | os.O_NONBLOCK)
+        # Level-triggered: recv() reads one report at a time, so any
+        # remaining queued reports must wake up the next wait
+        self._poller = select.epoll()
+        self._poller.register(self._fd, select.EPOLLIN)
+        # Rodents are frequently dropped without close(), the finalizer must
+        # not reference self or it would keep the rodent alive
+        self._finalizer = weakref.finalize(self, _close_fds, self._fd, self._poller)
+
+    def close(self) -> None:
+        """
+        Close the file descriptor for this device. Does nothing if the
+        device is not open.
+        """
+        if self._fd >= 0:
+            self._finalizer()
+            self._fd = -1
 
     @property
     def info(self) -> DeviceInfo:
@@ -600,7 +849,14 @@ class Rodent(GObject.Object):
     def report_descriptor(self) -> Optional[bytes]:
         return self._info.report_descriptor
 
-    @property
+    @functools.cached_property
+    def _rdesc(self) -> Optional[ratbag.hid.ReportDescriptor]:
+        # Parsed on first use, many devices never need it
+        if not self._load_report_descriptor or not self.report_descriptor:
+            return None
+        return _parse_report_descriptor(self.report_descriptor)
+
+    @functools.cached_property
     def report_ids(self) -> Dict[str, Tuple[int, ...]]:
         """
         A dictionary containg the list each of "feature", "input" and "output"
@@ -612,7 +868,7 @@ class Rodent(GObject.Object):
             "output": tuple(),
             "feature": tuple(),
         }
-        if self.report_descriptor is not None:
+        if self._rdesc is not None:
             ids["input"] = tuple([r.report_id for r in self._rdesc.input_reports])
             ids["output"] = tuple([r.report_id for r in self._rdesc.output_reports])
             ids["feature"] = tuple([r.report_id for r in self._rdesc.feature_reports])
@@ -637,23 +893,7 @@ class Rodent(GObject.Object):
             },
         )
         blackbox.add_recorder(self._recorder)
-
-        def cb_logtx(device, data):
-            self._recorder.log_tx(data)
-
-        def cb_logrx(device, data):
-            self._recorder.log_rx(data)
-
-        def cb_ioctl_tx(device, ioctl_name, bytes):
-            self._recorder.log_ioctl_tx(ioctl_name, bytes)
-
-        def cb_ioctl_rx(device, ioctl_name, bytes):
-            self._recorder.log_ioctl_rx(ioctl_name, bytes)
-
-        self.connect("data-from-device", cb_logrx)
-        self.connect("data-to-device", cb_logtx)
-        self.connect("ioctl-command", cb_ioctl_tx)
-        self.connect("ioctl-reply", cb_ioctl_rx)
+        self.connect_to_recorder(self._recorder)
         self._recorder.start()
         return self._recorder
 
@@ -667,45 +907,179 @@ class Rodent(GObject.Object):
         """
         Send data to the device
         """
-        logger.debug(Rodent.Request(bytes))
-        self.emit("data-to-device", bytes)
-        self._fd.write(bytes)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(Rodent.Request(bytes))
+        for r in self._recorders:
+            r.log_tx(bytes)
+        os.write(self._fd, bytes)
 
-    def recv(self) -> Optional[bytes]:
-        """
-        Receive data from the device. This method waits synchronously for the data.
+    def send_many(self, reports: Sequence[bytes]) -> None:
         """
-        poll = select.poll()
-        poll.register(self._fd, select.POLLIN)
+        Send each of the given reports to the device, in order.
 
-        while True:
-            fds = poll.poll(1000)
-            if not fds:
-                continue  # block until we get an answer or error
+        .. note:: hidraw treats each ``write()`` as exactly one report,
+                  so these cannot be merged into a single ``writev()``.
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for data in reports:
+            if debug:
+                logger.debug(Rodent.Request(data))
+            for r in self._recorders:
+                r.log_tx(data)
+            os.write(self._fd, data)
+
+    def _wait_for_data(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until we have data available on the fd or an error occured.
+        Returns ``False`` if the timeout (in seconds) expired first.
+        """
+        # Without a timeout we sleep until something happens, we get woken
+        # up with EPOLLHUP/EPOLLERR if the device goes away
+        ready = self._poller.poll(-1 if timeout is None else timeout)
+        if not ready:
+            return False
+        ((_, events),) = ready
+        if not events & select.EPOLLIN:
+            raise OSError(errno.ENODEV, f"Device {self.path} disconnected")
+        return True
+
+    def recv(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Receive data from the device. This method waits synchronously for the
+        data, for at most ``timeout`` seconds if given.
 
-            data = self._fd.read()
+        :return: the data or ``None`` if the timeout expired
+        """
+        # Replies often arrive before we get here, so try the non-blocking
+        # read first and only wait if nothing is queued yet
+        try:
+            data = os.read(self._fd, _HIDRAW_MAX_REPORT_SIZE)
+        except BlockingIOError:
+            if not self._wait_for_data(timeout):
+                return None
+            data = os.read(self._fd, _HIDRAW_MAX_REPORT_SIZE)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(Rodent.Reply(data))
-            self.emit("data-from-device", data)
-            return data
+        for r in self._recorders:
+            r.log_rx(data)
+        return data
 
-        return None
+    def recv_async(self, callback: Callable[["Rodent", Optional[bytes]], None]) -> None:
+        """
+        Receive data from the device without blocking. The ``callback`` is
+        invoked from the GLib main loop with this device and the data once a
+        report is available, or with ``None`` if the device was disconnected.
+        """
 
-    def hid_get_feature(self, report_id: int) -> bytes:
+        def ready(fd, condition):
+            if not condition & GLib.IO_IN:
+                callback(self, None)
+                return False
+            data = os.read(fd, _HIDRAW_MAX_REPORT_SIZE)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(Rodent.Reply(data))
+            for r in self._recorders:
+                r.log_rx(data)
+            callback(self, data)
+            return False
+
+        GLib.io_add_watch(
+            self._fd,
+            GLib.PRIORITY_DEFAULT,
+            GLib.IO_IN | GLib.IO_HUP | GLib.IO_ERR,
+            ready,
+        )
+
+    def recv_batch(self, timeout: Optional[float] = None) -> List[bytes]:
         """
-        Return a list of bytes as returned by this HID GetFeature request
+        Receive all reports currently queued on the device, in order. This
+        method waits synchronously until at least one report is available,
+        for at most ``timeout`` seconds if given.
+
+        :return: the reports, an empty list if the timeout expired
         """
+        if not self._wait_for_data(timeout):
+            return []
+        reports = []
+        while True:
+            try:
+                reports.append(os.read(self._fd, _HIDRAW_MAX_REPORT_SIZE))
+            except BlockingIOError:
+                break
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for data in reports:
+            if debug:
+                logger.debug(Rodent.Reply(data))
+            for r in self._recorders:
+                r.log_rx(data)
+        return reports
+
+    def _feature_buffer(self, report_id: int) -> Tuple[bytes, bytearray, int]:
+        """
+        Return the GetFeature request, reply buffer and ioctl number for the
+        given report ID, created on first use.
+        """
+        try:
+            return self._feature_buffers[report_id]
+        except KeyError:
+            pass
+        assert self._rdesc is not None
         report = self._rdesc.feature_report_by_id(report_id)
         assert report is not None
-        rsize = report.size
-        buf = bytearray([report_id & 0xFF]) + bytearray(rsize - 1)
-        logger.debug(Rodent.IoctlCommand("HIDIOCGFEATURE", buf))
-        self.emit("ioctl-command", "HIDIOCGFEATURE", buf)
-
-        fcntl.ioctl(self._fd.fileno(), _IOC_HIDIOCGFEATURE(None, len(buf)), buf)
-        logger.debug(Rodent.IoctlReply("HIDIOCGFEATURE", buf))
-        self.emit("ioctl-reply", "HIDIOCGFEATURE", buf)
+        buf = bytearray(report.size)
+        buf[0] = report_id & 0xFF
+        entry = (bytes(buf), buf, _IOC_HIDIOCGFEATURE(None, report.size))
+        self._feature_buffers[report_id] = entry
+        return entry
+
+    def hid_get_feature(self, report_id: int) -> bytes:
+        """
+        Return a list of bytes as returned by this HID GetFeature request
+        """
+        _, buf, _ = self._feature_buffer(report_id)
+        self.hid_get_feature_into(report_id, buf)
         return bytes(buf)  # Note: first byte is report ID
 
+    def hid_get_feature_into(self, report_id: int, out: bytearray) -> int:
+        """
+        Issue a HID GetFeature request and write the reply into ``out``, which
+        must be at least as large as the report. This avoids the copy
+        :meth:`hid_get_feature` makes for its return value.
+
+        :return: the number of bytes the device returned, including the
+                 report ID. This may be less than the report size, the
+                 remainder of the report in ``out`` is zeroed.
+        """
+        request, _, ioc = self._feature_buffer(report_id)
+        size = len(request)
+        if len(out) < size:
+            raise ValueError(f"Buffer too small for report {report_id}: {len(out)}")
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(Rodent.IoctlCommand("HIDIOCGFEATURE", request))
+        for r in self._recorders:
+            r.log_ioctl_tx("HIDIOCGFEATURE", request)
+
+        with memoryview(out)[:size] as buf:
+            buf[:] = request  # in-place, no allocation
+            length = fcntl.ioctl(self._fd, ioc, buf)
+            if debug or self._recorders:
+                reply = bytes(buf)
+                if debug:
+                    logger.debug(Rodent.IoctlReply("HIDIOCGFEATURE", reply))
+                for r in self._recorders:
+                    r.log_ioctl_rx("HIDIOCGFEATURE", reply)
+        return length
+
+    def hid_get_feature_many(self, report_ids: Sequence[int]) -> Dict[int, bytes]:
+        """
+        Issue a HID GetFeature request for each of the given report IDs, in
+        order, and return a dictionary of the replies keyed by report ID.
+        """
+        return {report_id: self.hid_get_feature(report_id) for report_id in report_ids}
+
     def hid_set_feature(self, report_id: int, data: bytes) -> None:
         """
         Issue a HID SetFeature request for the given report ID with the given
@@ -713,40 +1087,46 @@ class Rodent(GObject.Object):
 
         .. note:: the first element of data must be the report_id
         """
-        report = self._rdesc.feature_report_by_id(report_id)
-        assert report is not None
+        assert self._rdesc is not None
+        assert report_id in self._rdesc.feature_report_ids
         assert data[0] == report_id
-        buf = bytearray(data)
+        # ioctl needs a mutable buffer to give us the return value, but the
+        # kernel only reads it so a caller's bytearray can be used as-is
+        buf = data if isinstance(data, bytearray) else bytearray(data)
 
-        logger.debug(Rodent.IoctlCommand("HIDIOCSFEATURE", buf))
-        self.emit("ioctl-command", "HIDIOCSFEATURE", buf)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(Rodent.IoctlCommand("HIDIOCSFEATURE", data))
+        for r in self._recorders:
+            r.log_ioctl_tx("HIDIOCSFEATURE", data)
 
-        sz = fcntl.ioctl(self._fd.fileno(), _IOC_HIDIOCSFEATURE(None, len(buf)), buf)
+        sz = fcntl.ioctl(self._fd, _IOC_HIDIOCSFEATURE(None, len(buf)), buf)
         if sz != len(data):
             raise OSError("Failed to write data: {data} - bytes written: {sz}")
 
     def connect_to_recorder(self, recorder: ratbag.Recorder) -> None:
         """
         Connect this device to the given recorder. This is a convenience
-        method to simplify drivers.
+        method to simplify drivers. Connecting the same recorder twice
+        does nothing.
         """
+        # Recorders are attrs classes and compare by value, not identity
+        if not any(r is recorder for r in self._recorders):
+            self._recorders.append(recorder)
 
-        def cb_logtx(device, data):
-            recorder.log_tx(data)
 
-        def cb_logrx(device, data):
-            recorder.log_rx(data)
+_UPPERCASE = re.compile("([A-Z])")
 
-        def cb_ioctl_tx(device, ioctl_name, bytes):
-            recorder.log_ioctl_tx(ioctl_name, bytes)
 
-        def cb_ioctl_rx(device, ioctl_name, bytes):
-            recorder.log_ioctl_rx(ioctl_name, bytes)
+@functools.lru_cache(maxsize=None)
+def _snake_case(name: str) -> str:
+    """
+    Convert a CamelCase name to snake_case. The same handful of keys is
+    used across all data files, so the result is cached.
 
-        self.connect("data-from-device", cb_logrx)
-        self.connect("data-to-device", cb_logtx)
-        self.connect("ioctl-command", cb_ioctl_tx)
-        self.connect("ioctl-reply", cb_ioctl_rx)
+        >>> _snake_case("DpiRange")
+        'dpi_range'
+    """
+    return _UPPERCASE.sub(r"_\1", name).lower().lstrip("_")
 
 
 class DeviceConfig:
@@ -774,10 +1154,7 @@ class DeviceConfig:
     def __init__(self, match: str, config_dict: Dict[str, Any]):
         self._match = match
         for name, value in config_dict.items():
-            snake_name = "".join(
-                ["_" + i.lower() if i.isupper() else i for i in name]
-            ).lstrip("_")
-
+            snake_name = _snake_case(name)
             assert not hasattr(self, snake_name)
             setattr(self, snake_name, value)
 
@@ -830,7 +1207,9 @@ class Driver(GObject.Object):
     def __init__(self):
         GObject.Object.__init__(self)
         self.name = None
-        self.connect("device-added", self._device_sanity_check)
+        # The check is nothing but asserts, no point connecting with -O
+        if __debug__:
+            self.connect("device-added", self._device_sanity_check)
 
     def _device_sanity_check(
         self, driver: "ratbag.driver.Driver", device: ratbag.Device
@@ -841,17 +1220,16 @@ class Driver(GObject.Object):
         assert len(device.profiles) >= 1
         # We must not skip an index
         assert None not in device.profiles
-        nbuttons = len(device.profiles[0].buttons)
-        nres = len(device.profiles[0].resolutions)
-        nleds = len(device.profiles[0].leds)
+        p0 = device.profiles[0]
+        counts = (len(p0.buttons), len(p0.resolutions), len(p0.leds))
         # We must have at least *something* to configure
-        assert any([count > 0 for count in [nbuttons, nres, nleds]])
+        assert any(counts)
         # We don't support different numbers of features on profiles, they all
         # must have the same count
-        for p in device.profiles:
-            assert nbuttons == len(p.buttons)
-            assert nres == len(p.resolutions)
-            assert nleds == len(p.leds)
+        assert all(
+            counts == (len(p.buttons), len(p.resolutions), len(p.leds))
+            for p in device.profiles[1:]
+        )
 
     # The entry point
     @classmethod
@@ -907,13 +1285,21 @@ class HidrawDriver(Driver):
         self.supported_devices = supported_devices
 
     def start(self):
+        # A device plugged in while the monitor starts up shows up both in
+        # the list and as udev event, only handle it once
+        seen = set()
+
         def rodent_found(monitor, rodent):
+            if rodent.path in seen:
+                return
+            seen.add(rodent.path)
+            rodent.connect("disconnected", lambda r: seen.discard(r.path))
+
+            usbid = rodent.usbid
             try:
-                match = next(
-                    d for d in self.supported_devices if d.usbid == rodent.usbid
-                )
+                match = next(d for d in self.supported_devices if d.usbid == usbid)
                 logger.debug(
-                    f"Using driver '{self.DRIVER_NAME}' for {rodent.usbid} {rodent.path}"
+                    f"Using driver '{self.DRIVER_NAME}' for {usbid} {rodent.path}"
                 )
             except StopIteration:
                 return
@@ -971,14 +1357,20 @@ class HidrawDriver(Driver):
 # We only need a small subset of it but we do need to hook into the transport
 # later, so copying it was easier than modifying hidtools
 def _ioctl(fd, EVIOC, code, return_type, buf=None):
-    size = struct.calcsize(return_type)
+    s = _struct(return_type)
     if buf is None:
-        buf = size * "\x00"
-    abs = fcntl.ioctl(fd, EVIOC(code, size), buf)
-    return struct.unpack(return_type, abs)
+        buf = bytes(s.size)
+    abs = fcntl.ioctl(fd, EVIOC(code, s.size), buf)
+    return s.unpack(abs)
+
+
+@functools.lru_cache(maxsize=64)
+def _struct(fmt):
+    return struct.Struct(fmt)
 
 
-# extracted from <asm-generic/ioctl.h>
+# extracted from <asm-generic/ioctl.h>, alpha, mips, powerpc and sparc use
+# a different layout
 _IOC_WRITE = 1
 _IOC_READ = 2
 
@@ -1018,28 +1410,38 @@ def _IOW(type, nr, size):
 
 
 # define HIDIOCGFEATURE(len) _IOC(_IOC_WRITE|_IOC_READ, 'H', 0x07, len)
+_HIDIOCGFEATURE_BASE = _IOC(_IOC_WRITE | _IOC_READ, "H", 0x07, 0)
+
+
 def _IOC_HIDIOCGFEATURE(none, len):
-    return _IOC(_IOC_WRITE | _IOC_READ, "H", 0x07, len)
+    return _HIDIOCGFEATURE_BASE | (len << _IOC_SIZESHIFT)
 
 
 def _HIDIOCGFEATURE(fd, report_id, rsize):
     """get feature report"""
-    assert report_id <= 255 and report_id > -1
-
     # rsize has the report length in it
-    buf = bytearray([report_id & 0xFF]) + bytearray(rsize - 1)
-    fcntl.ioctl(fd, _IOC_HIDIOCGFEATURE(None, len(buf)), buf)
-    return list(buf)  # Note: first byte is report ID
+    buf = bytearray(rsize)
+    _HIDIOCGFEATURE_into(fd, report_id, buf)
+    return bytes(buf)  # Note: first byte is report ID
+
+
+def _HIDIOCGFEATURE_into(fd, report_id, buf):
+    """get feature report into the caller's buffer, returns the length"""
+    buf[0] = report_id & 0xFF
+    return fcntl.ioctl(fd, _IOC_HIDIOCGFEATURE(None, len(buf)), buf)
 
 
 # define HIDIOCSFEATURE(len) _IOC(_IOC_WRITE|_IOC_READ, 'H', 0x06, len)
+_HIDIOCSFEATURE_BASE = _IOC(_IOC_WRITE | _IOC_READ, "H", 0x06, 0)
+
+
 def _IOC_HIDIOCSFEATURE(none, len):
-    return _IOC(_IOC_WRITE | _IOC_READ, "H", 0x06, len)
+    return _HIDIOCSFEATURE_BASE | (len << _IOC_SIZESHIFT)
 
 
 def _HIDIOCSFEATURE(fd, data):
     """set feature report"""
 
-    buf = bytearray(data)
+    buf = data if isinstance(data, bytearray) else bytearray(data)
     sz = fcntl.ioctl(fd, _IOC_HIDIOCSFEATURE(None, len(buf)), buf)
     return sz
@@ -726,9 +726,8 @@ class Hidpp20Device(GObject.Object):
 
     def start(self) -> None:
         # We require both the Long and Short report IDs for this driver
-        supported = [
-            id for id in self.hidraw_device.report_ids["input"] if id in tuple(ReportID)
-        ]
+        known = frozenset(ReportID)
+        supported = [id for id in self.hidraw_device.report_ids["input"] if id in known]
 
         required = (ReportID.SHORT, ReportID.LONG)
         if not (set(supported) & set(required)):
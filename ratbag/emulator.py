@@ -9,7 +9,7 @@ import logging
 import pathlib
 import yaml
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 
 import ratbag
 import ratbag.driver
@@ -156,11 +156,25 @@ class YamlDevice(ratbag.driver.Rodent):
                 f"Unable to find reply to request: {as_hex(data)}"
             )
 
-    def recv(self) -> bytes:
+    def send_many(self, reports: Sequence[bytes]) -> None:
+        for data in reports:
+            self.send(data)
+
+    def recv(self, timeout: Optional[float] = None) -> bytes:
         """Return the matching reply for the last :meth:`send` call"""
         logger.debug(f"recv: {as_hex(self.recv_data)}")
         return self.recv_data
 
+    def recv_batch(self, timeout: Optional[float] = None) -> List[bytes]:
+        """Return the matching reply for the last :meth:`send` call as list"""
+        return [self.recv()]
+
+    def recv_async(
+        self, callback: Callable[[ratbag.driver.Rodent, Optional[bytes]], None]
+    ) -> None:
+        """Invoke ``callback`` immediately with the reply to the last :meth:`send`"""
+        callback(self, self.recv())
+
     def hid_get_feature(self, report_id: int) -> bytes:
         for r in self.ioctls.get("HIDIOCGFEATURE", {}).values():
             # we know the first byte is the report ID
@@ -171,6 +185,11 @@ class YamlDevice(ratbag.driver.Rodent):
         else:
             raise InsufficientDataError(f"HIDIOCGFEATURE report_id {report_id}")
 
+    def hid_get_feature_into(self, report_id: int, out: bytearray) -> int:
+        data = self.hid_get_feature(report_id)
+        out[: len(data)] = data
+        return len(data)
+
     def hid_set_feature(self, report_id: int, data: bytes) -> None:
         for r in self.ioctls.get("HIDIOCSFEATURE", {}).values():
             if r.tx == data:
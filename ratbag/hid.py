@@ -2,10 +2,11 @@
 
 import attr
 import enum
+import functools
 import libevdev
 import struct
 
-from typing import Dict, Iterator, Optional, Tuple
+from typing import Dict, FrozenSet, Iterator, Optional, Tuple
 
 
 class Collection(enum.IntEnum):
@@ -1281,6 +1282,13 @@ class ReportDescriptor:
     def feature_reports(self) -> Tuple[Report, ...]:
         return tuple(self._reports[Report.Type.FEATURE].values())
 
+    @functools.cached_property
+    def feature_report_ids(self) -> FrozenSet[int]:
+        """
+        The report IDs of all :attr:`feature_reports`
+        """
+        return frozenset(self._reports[Report.Type.FEATURE])
+
     def input_report_by_id(self, report_id) -> Optional[Report]:
         return self._reports[Report.Type.INPUT].get(report_id, None)
 
@@ -9,7 +9,6 @@ import binascii
 import configparser
 import logging
 import pkg_resources
-import pyudev
 import struct
 
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -77,6 +76,8 @@ def find_hidraw_devices() -> List[str]:
     """
     :return: a list of local hidraw device paths ``["/dev/hidraw0", "/dev/hidraw1"]``
     """
+    import pyudev
+
     devices = []
 
     context = pyudev.Context()
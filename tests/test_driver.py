@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+#
+# SPDX-License-Identifier: MIT
+#
+# This file is formatted with Python Black
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import gc
+import os
+import socket
+
+from gi.repository import GLib
+
+import pytest
+
+import ratbag
+import ratbag.driver
+
+
+def new_rodent(path: str) -> ratbag.driver.Rodent:
+    info = ratbag.driver.DeviceInfo(
+        path=Path(path),
+        syspath=Path("/sys/does/not/exist"),
+        name="Test Rodent",
+        bus="usb",
+        vid=0x1234,
+        pid=0xABCD,
+    )
+    return ratbag.driver.Rodent(info)
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    monkeypatch.setattr(ratbag.driver, "_udev_context", lambda: None)
+    monkeypatch.setattr(
+        ratbag.driver.Rodent,
+        "from_udev_device",
+        lambda device: new_rodent(device.device_node),
+    )
+    return ratbag.driver.HidrawMonitor()
+
+
+def settle(monitor):
+    # Don't wait for the settle timeout
+    if monitor._pending_source:
+        GLib.source_remove(monitor._pending_source)
+        monitor._add_pending()
+
+
+def udev_event(monitor, action: str, device_node: str, settled: bool = True):
+    monitor._handle_udev_event(MagicMock(action=action, device_node=device_node))
+    if settled:
+        settle(monitor)
+
+
+def test_monitor_add_remove(monitor):
+    found = []
+    monitor.connect("rodent-found", lambda m, r: found.append(r))
+
+    # hidraw0 was found by the sysfs scan in start() and then we get an
+    # add event for it too
+    rodent = new_rodent("/dev/hidraw0")
+    monitor._rodents.append(rodent)
+    udev_event(monitor, "add", "/dev/hidraw0")
+    assert monitor.list() == [rodent]
+    assert found == []
+
+    udev_event(monitor, "add", "/dev/hidraw1")
+    assert [r.path for r in monitor.list()] == [
+        Path("/dev/hidraw0"),
+        Path("/dev/hidraw1"),
+    ]
+    assert found == monitor.list()[1:]
+
+    disconnected = []
+    rodent.connect("disconnected", lambda r: disconnected.append(r))
+    udev_event(monitor, "remove", "/dev/hidraw0")
+    assert disconnected == [rodent]
+    assert [r.path for r in monitor.list()] == [Path("/dev/hidraw1")]
+
+    udev_event(monitor, "remove", "/dev/hidraw1")
+    assert monitor.list() == []
+
+
+def test_monitor_add_failure(monitor, monkeypatch):
+    def from_udev_device(device):
+        if device.device_node == "/dev/hidraw0":
+            raise UnboundLocalError("broken device")
+        return new_rodent(device.device_node)
+
+    monkeypatch.setattr(ratbag.driver.Rodent, "from_udev_device", from_udev_device)
+
+    # Both arrive in the same burst, the first one failing must not drop
+    # the second one
+    udev_event(monitor, "add", "/dev/hidraw0", settled=False)
+    udev_event(monitor, "add", "/dev/hidraw1", settled=False)
+    settle(monitor)
+    assert [r.path for r in monitor.list()] == [Path("/dev/hidraw1")]
+    assert monitor._pending == {}
+
+
+@pytest.fixture
+def hidraw(monkeypatch):
+    """
+    A :class:`Rodent` whose "device node" is one end of a socketpair, the
+    test talks to the other end. SOCK_SEQPACKET keeps the report boundaries
+    like hidraw does.
+    """
+    sock, peer = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    sock.setblocking(False)
+    fd = sock.detach()
+    monkeypatch.setattr(os, "open", lambda path, flags: fd)
+
+    rodent = new_rodent("/dev/hidraw0")
+    rodent.open()
+    yield rodent, peer
+    rodent.close()
+    peer.close()
+
+
+def test_rodent_send_recv(hidraw):
+    rodent, peer = hidraw
+    recorder = MagicMock()
+    rodent.connect_to_recorder(recorder)
+
+    rodent.send(b"\x01\x02")
+    rodent.send_many([b"\x03", b"\x04\x05"])
+    assert [peer.recv(64) for _ in range(3)] == [b"\x01\x02", b"\x03", b"\x04\x05"]
+
+    assert rodent.recv(timeout=0.01) is None
+    peer.send(b"\x10\x11")
+    assert rodent.recv(timeout=0.01) == b"\x10\x11"
+    peer.send(b"\x12")
+    assert rodent.recv() == b"\x12"
+
+    assert rodent.recv_batch(timeout=0.01) == []
+    for data in [b"\x20", b"\x21\x22", b"\x23"]:
+        peer.send(data)
+    assert rodent.recv_batch(timeout=0.01) == [b"\x20", b"\x21\x22", b"\x23"]
+
+    assert [c.args for c in recorder.log_tx.call_args_list] == [
+        (b"\x01\x02",),
+        (b"\x03",),
+        (b"\x04\x05",),
+    ]
+    assert [c.args for c in recorder.log_rx.call_args_list] == [
+        (b"\x10\x11",),
+        (b"\x12",),
+        (b"\x20",),
+        (b"\x21\x22",),
+        (b"\x23",),
+    ]
+
+
+def test_rodent_recv_async(hidraw):
+    rodent, peer = hidraw
+    loop = GLib.MainLoop()
+    GLib.timeout_add(500, loop.quit)
+    received = []
+
+    def callback(r, data):
+        received.append((r, data))
+        loop.quit()
+
+    rodent.recv_async(callback)
+    peer.send(b"\x01\x02")
+    loop.run()
+    assert received == [(rodent, b"\x01\x02")]
+
+
+def test_rodent_close_on_release(monkeypatch):
+    sock, peer = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    fd = sock.detach()
+    monkeypatch.setattr(os, "open", lambda path, flags: fd)
+
+    rodent = new_rodent("/dev/hidraw0")
+    rodent.open()
+    epfd = rodent._poller.fileno()
+    del rodent
+    gc.collect()
+
+    # The rodent was never closed, the fds must be closed anyway
+    for closed in (fd, epfd):
+        with pytest.raises(OSError):
+            os.fstat(closed)
+    peer.close()
+
+
+def test_usbid_from_string():
+    usbid = ratbag.driver.UsbId.from_string("usb:046d:c332")
+    assert usbid == ratbag.driver.UsbId("usb", 0x046D, 0xC332)
+    assert str(usbid) == "usb:046d:c332"
+
+    usbid = ratbag.driver.UsbId.from_string("bluetooth:46D:B012:0")
+    assert usbid == ratbag.driver.UsbId("bluetooth", 0x046D, 0xB012)
+
+    for s in [
+        "",
+        "usb",
+        "usb:046d",
+        "usb:046d:",
+        "usb:046d:c332-x",
+        "usb:046d:c332.5",
+        "usb:046d:0c3320",
+        "i2c:046d:c332",
+        "usb:xyz:c332",
+    ]:
+        with pytest.raises(ValueError):
+            ratbag.driver.UsbId.from_string(s)
+
+
+def test_usbid_invalid():
+    with pytest.raises(ValueError):
+        ratbag.driver.UsbId("i2c", 0x046D, 0xC332)
+    with pytest.raises(ValueError):
+        ratbag.driver.UsbId("usb", 0x10000, 0xC332)
+    with pytest.raises(ValueError):
+        ratbag.driver.UsbId("usb", 0x046D, -1)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+#
+# SPDX-License-Identifier: MIT
+#
+# This file is formatted with Python Black
+
+import pytest
+
+import ratbag.emulator
+
+RECORDING = """
+logger: YAMLDeviceRecorder
+attributes:
+  - { name: name, type: str, value: test device }
+data:
+  - { type: fd, tx: [1, 2] }
+  - { type: fd, rx: [3, 4, 5] }
+"""
+
+
+@pytest.fixture
+def device(tmp_path):
+    recording = tmp_path / "hidraw0.yml"
+    recording.write_text(RECORDING)
+    device = ratbag.emulator.YamlDevice(recording)
+    device.open()
+    return device
+
+
+def test_recv(device):
+    device.send(bytes([1, 2]))
+    assert device.recv() == bytes([3, 4, 5])
+    assert device.recv(timeout=0.1) == bytes([3, 4, 5])
+    assert device.recv_batch() == [bytes([3, 4, 5])]
+    assert device.recv_batch(timeout=0.1) == [bytes([3, 4, 5])]
+
+    received = []
+    device.recv_async(lambda d, data: received.append((d, data)))
+    assert received == [(device, bytes([3, 4, 5]))]
+
+
+def test_send_unknown(device):
+    with pytest.raises(ratbag.emulator.InsufficientDataError):
+        device.send(bytes([9]))
@@ -47,6 +47,7 @@ def test_rdesc_parser():
     assert rdesc.input_report_by_id(1) is not None
     assert rdesc.output_report_by_id(1) is None
     assert rdesc.feature_report_by_id(1) is None
+    assert 1 not in rdesc.feature_report_ids
 
     # input_reports is a list
     r = rdesc.input_report_by_id(1)
@@ -99,6 +100,7 @@ def test_rdesc_parser():
     assert r not in rdesc.input_reports
     assert r not in rdesc.output_reports
     assert r.report_id == 4
+    assert 4 in rdesc.feature_report_ids
     assert r.size == 2 + 1
 
     # 0x85, 0x06,                    //  Report ID (6)                      149
@@ -5,7 +5,7 @@
 # This file is formatted with Python Black
 #
 
-from dbus_next import BusType, Message
+from dbus_next import BusType, Message, MessageType, Variant
 from dbus_next.glib import MessageBus
 from unittest.mock import MagicMock
 from gi.repository import GLib
@@ -23,6 +23,8 @@ import os
 
 counter = count()
 
+DEVICE_PATH = "/org/freedesktop/ratbag1/device/hidraw990"
+
 pytestmark = pytest.mark.skipif(
     "DBUS_SESSION_BUS_ADDRESS" not in os.environ, reason="DBus daemon not available"
 )
@@ -292,6 +294,7 @@ def test_manager_introspection(bus, loop, ratbag):
                 ],
                 methods=[
                     Method("Commit"),
+                    Method("Snapshot"),
                 ],
                 signals=[
                     Signal("Resync"),
@@ -469,3 +472,179 @@ def test_manager_introspection(bus, loop, ratbag):
 
     if failed:
         raise error
+
+
+def run_with_devices(bus, loop, ratbag, func):
+    """
+    Start ratbagd, add the devices from the ``ratbag`` fixture and call
+    ``func`` from within the main loop. Any exception raised by ``func`` is
+    re-raised here.
+    """
+    ratbagd = Ratbagd(ratbag)
+    ratbagd.init_dbus(bus.busname, use_system_bus=False)
+    ratbagd.start()
+
+    error = None
+
+    def add_devices():
+        nonlocal error
+
+        for d in ratbag._devices:
+            ratbagd.manager.cb_device_added(ratbagd, d)
+        try:
+            func()
+        except Exception as e:
+            error = e
+        loop.quit()
+
+    GLib.idle_add(add_devices)
+
+    loop.run()
+
+    if error is not None:
+        raise error
+
+
+def test_device_snapshot(bus, loop, ratbag):
+    ratbag._devices[0].profiles[0].buttons[2].action.button = 3
+
+    def verify_snapshot():
+        reply = bus.bus.call_sync(
+            Message(
+                destination=bus.busname,
+                path=DEVICE_PATH,
+                interface="org.freedesktop.ratbag1.Device",
+                member="Snapshot",
+            )
+        )
+        assert reply.message_type == MessageType.METHOD_RETURN, reply.body
+        assert reply.signature == "a(oa{sv})"
+
+        # One entry per profile, followed by its resolutions, buttons and leds
+        expected = []
+        for p in range(5):
+            prefix = f"{DEVICE_PATH}/p/{p}"
+            expected.append(prefix)
+            expected.extend(f"{prefix}/r/{i}" for i in range(3))
+            expected.extend(f"{prefix}/b/{i}" for i in range(8))
+            expected.extend(f"{prefix}/l/{i}" for i in range(2))
+        assert [objpath for objpath, _ in reply.body[0]] == expected
+
+        objects = {objpath: props for objpath, props in reply.body[0]}
+
+        profile = objects[f"{DEVICE_PATH}/p/0"]
+        assert profile["Name"].value == "profile 0"
+        assert profile["Resolutions"].value == expected[1:4]
+
+        resolution = objects[f"{DEVICE_PATH}/p/0/r/0"]
+        assert resolution["Resolution"].value == Variant("(uu)", [100, 200])
+        assert resolution["IsActive"].value is True
+        assert objects[f"{DEVICE_PATH}/p/0/r/1"]["IsActive"].value is False
+
+        mapping = objects[f"{DEVICE_PATH}/p/0/b/2"]["Mapping"].value
+        assert mapping[0] == ratbag_mod.Action.Type.BUTTON.value
+        assert mapping[1] == Variant("u", 3)
+
+        led = objects[f"{DEVICE_PATH}/p/0/l/0"]
+        assert led["Mode"].value == ratbag_mod.Led.Mode.OFF
+        assert led["Color"].value == [0, 0, 0]
+
+    run_with_devices(bus, loop, ratbag, verify_snapshot)
+
+
+@pytest.mark.parametrize(
+    "objpath,interface,name,unchanged,changed,setter",
+    [
+        (
+            "p/0/r/0",
+            "Resolution",
+            "Resolution",
+            Variant("v", Variant("(uu)", [100, 200])),
+            Variant("v", Variant("(uu)", [300, 400])),
+            "set_dpi",
+        ),
+        ("p/0/l/0", "Led", "Mode", Variant("u", 0), Variant("u", 1), "set_mode"),
+        (
+            "p/0/l/0",
+            "Led",
+            "Color",
+            Variant("(uuu)", [0, 0, 0]),
+            Variant("(uuu)", [255, 0, 0]),
+            "set_color",
+        ),
+        (
+            "p/0/l/0",
+            "Led",
+            "EffectDuration",
+            Variant("u", 0),
+            Variant("u", 500),
+            "set_effect_duration",
+        ),
+        (
+            "p/0/l/0",
+            "Led",
+            "Brightness",
+            Variant("u", 0),
+            Variant("u", 100),
+            "set_brightness",
+        ),
+    ],
+)
+def test_set_unchanged_property(
+    bus, loop, ratbag, objpath, interface, name, unchanged, changed, setter
+):
+    """
+    Setting a property to its current value must neither call into ratbag
+    nor emit PropertiesChanged
+    """
+    profile = ratbag._devices[0].profiles[0]
+    feature = profile.resolutions[0] if interface == "Resolution" else profile.leds[0]
+    objpath = f"{DEVICE_PATH}/{objpath}"
+
+    def verify_set():
+        changes = []
+
+        def on_message(msg):
+            if (
+                msg.message_type == MessageType.SIGNAL
+                and msg.member == "PropertiesChanged"
+                and msg.path == objpath
+            ):
+                changes.append(list(msg.body[1]))
+
+        bus.bus.add_message_handler(on_message)
+        bus.bus.call_sync(
+            Message(
+                destination="org.freedesktop.DBus",
+                path="/org/freedesktop/DBus",
+                interface="org.freedesktop.DBus",
+                member="AddMatch",
+                signature="s",
+                body=[f"type='signal',path='{objpath}'"],
+            )
+        )
+
+        def set_property(value):
+            # The signal is sent before the reply, so by the time we get the
+            # reply any PropertiesChanged has been processed
+            reply = bus.bus.call_sync(
+                Message(
+                    destination=bus.busname,
+                    path=objpath,
+                    interface="org.freedesktop.DBus.Properties",
+                    member="Set",
+                    signature="ssv",
+                    body=[f"org.freedesktop.ratbag1.{interface}", name, value],
+                )
+            )
+            assert reply.message_type == MessageType.METHOD_RETURN, reply.body
+
+        set_property(unchanged)
+        assert changes == []
+        getattr(feature, setter).assert_not_called()
+
+        set_property(changed)
+        assert changes == [[name]]
+        getattr(feature, setter).assert_called_once()
+
+    run_with_devices(bus, loop, ratbag, verify_set)